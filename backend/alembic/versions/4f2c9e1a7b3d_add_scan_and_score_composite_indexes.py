@@ -0,0 +1,31 @@
+"""add_scan_and_score_composite_indexes
+
+Revision ID: 4f2c9e1a7b3d
+Revises: 21aca27478d6
+Create Date: 2026-10-17 10:12:41.208311
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f2c9e1a7b3d'
+down_revision = '21aca27478d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_scans_project_id_created_at', 'scans', ['project_id', 'created_at'], unique=False)
+    op.create_index('ix_visibility_scores_project_id_date', 'visibility_scores', ['project_id', 'date'], unique=False)
+    # The composite indexes lead with project_id, so the single-column ones are redundant
+    op.drop_index(op.f('ix_scans_project_id'), table_name='scans')
+    op.drop_index(op.f('ix_visibility_scores_project_id'), table_name='visibility_scores')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_visibility_scores_project_id'), 'visibility_scores', ['project_id'], unique=False)
+    op.create_index(op.f('ix_scans_project_id'), 'scans', ['project_id'], unique=False)
+    op.drop_index('ix_visibility_scores_project_id_date', table_name='visibility_scores')
+    op.drop_index('ix_scans_project_id_created_at', table_name='scans')
@@ -1,15 +1,16 @@
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from google.oauth2 import id_token
 from google.auth.transport import requests
-import uuid
 from datetime import datetime, timedelta
 from jose import jwt
 
 from ..config import get_settings
-from ..database import get_db
+from ..database import get_db, generate_id
 from ..models.user import User
+from ..services.http_client import get_http_client
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 settings = get_settings()
@@ -24,6 +25,29 @@ class AuthResponse(BaseModel):
     email: str
     name: str
 
+def get_or_create_user(db: Session, email: str, name: str) -> User:
+    """Find a user by email or create a new Google user"""
+    user = db.query(User).filter(User.email == email).first()
+    
+    if not user:
+        user = User(
+            id=generate_id(),
+            email=email,
+            name=name,
+            provider="google",
+            is_subscribed=False
+        )
+        db.add(user)
+        # Only id/email/name are read back and they were all set above, so
+        # keep them loaded instead of re-SELECTing the new row after commit
+        db.expire_on_commit = False
+        try:
+            db.commit()
+        finally:
+            db.expire_on_commit = True
+    
+    return user
+
 @router.post("/google", response_model=AuthResponse)
 async def google_auth(auth_request: GoogleAuthRequest, db: Session = Depends(get_db)):
     """Authenticate with Google Sign-In"""
@@ -31,8 +55,9 @@ async def google_auth(auth_request: GoogleAuthRequest, db: Session = Depends(get
     try:
         # Try ID token first (native apps)
         if auth_request.id_token and not auth_request.id_token.startswith('ya29'):
-            # Verify the Google ID token
-            idinfo = id_token.verify_oauth2_token(
+            # Verify the Google ID token (fetches Google certs synchronously)
+            idinfo = await run_in_threadpool(
+                id_token.verify_oauth2_token,
                 auth_request.id_token,
                 requests.Request(),
                 settings.GOOGLE_CLIENT_ID
@@ -44,14 +69,12 @@ async def google_auth(auth_request: GoogleAuthRequest, db: Session = Depends(get
         else:
             # For web, use access token to get user info
             token_to_use = auth_request.access_token or auth_request.id_token
-            import httpx
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    'https://www.googleapis.com/oauth2/v3/userinfo',
-                    headers={'Authorization': f'Bearer {token_to_use}'}
-                )
-                response.raise_for_status()
-                idinfo = response.json()
+            response = await get_http_client().get(
+                'https://www.googleapis.com/oauth2/v3/userinfo',
+                headers={'Authorization': f'Bearer {token_to_use}'}
+            )
+            response.raise_for_status()
+            idinfo = response.json()
             
             email = idinfo.get("email")
             name = idinfo.get("name", "")
@@ -60,20 +83,8 @@ async def google_auth(auth_request: GoogleAuthRequest, db: Session = Depends(get
         if not email:
             raise HTTPException(status_code=400, detail="Email not found in token")
         
-        # Find or create user
-        user = db.query(User).filter(User.email == email).first()
-        
-        if not user:
-            user = User(
-                id=str(uuid.uuid4()),
-                email=email,
-                name=name,
-                provider="google",
-                is_subscribed=False
-            )
-            db.add(user)
-            db.commit()
-            db.refresh(user)
+        # Find or create user (blocking DB work, keep it off the event loop)
+        user = await run_in_threadpool(get_or_create_user, db, email, name)
         
         # Generate JWT token
         token_data = {
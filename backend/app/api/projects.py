@@ -2,15 +2,15 @@
 API endpoints for managing projects and running scans
 """
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query, Response
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, load_only
 from typing import List, Optional, Dict
-import uuid
 from datetime import datetime, timedelta
 
 from ..config import get_settings
-from ..database import get_db
+from ..database import get_db, generate_id
 from ..models.user import User
 from ..models.project import Project, Scan, ScanResult, VisibilityScore
 from ..api.auth import get_current_user
@@ -131,10 +131,25 @@ def get_user_project(project_id: str, user: User, db: Session) -> Project:
     return project
 
 
+def ensure_user_project(project_id: str, user: User, db: Session) -> None:
+    """Raise 404 unless the project exists and belongs to user (SELECT EXISTS, no row load)"""
+    exists = db.query(
+        db.query(Project).filter(
+            Project.id == project_id,
+            Project.user_id == user.id
+        ).exists()
+    ).scalar()
+    
+    if not exists:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+
 # Endpoints
+# These only do blocking ORM work, so they are plain `def` and FastAPI runs
+# them in its threadpool instead of on the event loop.
 
 @router.post("", response_model=ProjectResponse, status_code=201)
-async def create_project(
+def create_project(
     project_data: ProjectCreate,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -151,7 +166,7 @@ async def create_project(
     
     # Create project
     project = Project(
-        id=str(uuid.uuid4()),
+        id=generate_id(),
         user_id=user.id,
         name=project_data.name,
         domain=project_data.domain,
@@ -170,7 +185,7 @@ async def create_project(
 
 
 @router.get("", response_model=List[ProjectResponse])
-async def list_projects(
+def list_projects(
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -180,7 +195,7 @@ async def list_projects(
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
-async def get_project(
+def get_project(
     project_id: str,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -191,7 +206,7 @@ async def get_project(
 
 
 @router.patch("/{project_id}", response_model=ProjectResponse)
-async def update_project(
+def update_project(
     project_id: str,
     update_data: ProjectUpdate,
     user: User = Depends(get_current_user),
@@ -211,20 +226,31 @@ async def update_project(
 
 
 @router.delete("/{project_id}", status_code=204)
-async def delete_project(
+def delete_project(
     project_id: str,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Delete a project and all its data"""
-    project = get_user_project(project_id, user, db)
-    db.delete(project)
+    ensure_user_project(project_id, user, db)
+    
+    # Bulk DELETEs children-first instead of db.delete(project), whose ORM
+    # cascade loads every scan and scan result into memory just to delete them
+    scan_ids = db.query(Scan.id).filter(Scan.project_id == project_id)
+    db.query(ScanResult).filter(
+        ScanResult.scan_id.in_(scan_ids.scalar_subquery())
+    ).delete(synchronize_session=False)
+    db.query(Scan).filter(Scan.project_id == project_id).delete(synchronize_session=False)
+    db.query(VisibilityScore).filter(
+        VisibilityScore.project_id == project_id
+    ).delete(synchronize_session=False)
+    db.query(Project).filter(Project.id == project_id).delete(synchronize_session=False)
     db.commit()
     return None
 
 
 @router.post("/{project_id}/scan", response_model=ScanResponse, status_code=202)
-async def trigger_scan(
+def trigger_scan(
     project_id: str,
     scan_request: ScanTriggerRequest,
     background_tasks: BackgroundTasks,
@@ -242,7 +268,14 @@ async def trigger_scan(
             user.usage_reset_at = datetime.utcnow() + timedelta(days=30)
             db.commit()
         
-        if user.scans_used_this_month >= user.scans_per_month:
+        # Check and increment usage in one UPDATE so concurrent requests
+        # can't both pass the limit check
+        reserved = db.query(User).filter(
+            User.id == user.id,
+            User.scans_used_this_month < User.scans_per_month
+        ).update({User.scans_used_this_month: User.scans_used_this_month + 1})
+        
+        if not reserved:
             raise HTTPException(
                 status_code=403,
                 detail=f"Monthly scan limit reached. Upgrade to scan more projects."
@@ -250,19 +283,14 @@ async def trigger_scan(
     
     # Create scan record
     scan = Scan(
-        id=str(uuid.uuid4()),
+        id=generate_id(),
         project_id=project.id,
         scan_type=scan_request.scan_type,
         status="pending",
-        providers_checked=scan_request.providers or project.enabled_providers
+        providers_checked=list(dict.fromkeys(scan_request.providers or project.enabled_providers))
     )
     
     db.add(scan)
-    
-    # Increment usage counter
-    if not user.is_subscribed:
-        user.scans_used_this_month += 1
-    
     db.commit()
     db.refresh(scan)
     
@@ -273,35 +301,35 @@ async def trigger_scan(
 
 
 @router.get("/{project_id}/scans", response_model=List[ScanResponse])
-async def list_scans(
+def list_scans(
     project_id: str,
     limit: int = 10,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """List scans for a project"""
-    project = get_user_project(project_id, user, db)
+    ensure_user_project(project_id, user, db)
     
     scans = db.query(Scan).filter(
-        Scan.project_id == project.id
+        Scan.project_id == project_id
     ).order_by(Scan.created_at.desc()).limit(limit).all()
     
     return scans
 
 
 @router.get("/{project_id}/scans/{scan_id}", response_model=ScanResponse)
-async def get_scan(
+def get_scan(
     project_id: str,
     scan_id: str,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get a specific scan"""
-    project = get_user_project(project_id, user, db)
+    ensure_user_project(project_id, user, db)
     
     scan = db.query(Scan).filter(
         Scan.id == scan_id,
-        Scan.project_id == project.id
+        Scan.project_id == project_id
     ).first()
     
     if not scan:
@@ -311,42 +339,84 @@ async def get_scan(
 
 
 @router.get("/{project_id}/scans/{scan_id}/results", response_model=List[ScanResultResponse])
-async def get_scan_results(
+def get_scan_results(
     project_id: str,
     scan_id: str,
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get results for a specific scan"""
-    project = get_user_project(project_id, user, db)
+    """Get a page of results for a specific scan (total count in X-Total-Count)"""
+    ensure_user_project(project_id, user, db)
     
     scan = db.query(Scan).filter(
         Scan.id == scan_id,
-        Scan.project_id == project.id
+        Scan.project_id == project_id
     ).first()
     
     if not scan:
         raise HTTPException(status_code=404, detail="Scan not found")
     
-    results = db.query(ScanResult).filter(ScanResult.scan_id == scan.id).all()
+    total = db.query(func.count(ScanResult.id)).filter(
+        ScanResult.scan_id == scan.id
+    ).scalar()
+    response.headers["X-Total-Count"] = str(total)
+    
+    # Only hydrate the columns exposed by ScanResultResponse; the metadata
+    # and position JSON blobs are never returned to the client
+    results = db.query(ScanResult).options(
+        load_only(
+            ScanResult.id,
+            ScanResult.provider,
+            ScanResult.model,
+            ScanResult.prompt_type,
+            ScanResult.prompt_text,
+            ScanResult.response_text,
+            ScanResult.brand_found,
+            ScanResult.brand_mentions,
+            ScanResult.context_snippets,
+            ScanResult.mention_rank,
+            ScanResult.created_at,
+        )
+    ).filter(
+        ScanResult.scan_id == scan.id
+    ).order_by(
+        # Results of a scan share one commit timestamp; ids are UUIDv7 with a
+        # per-millisecond counter, so they sort in the order results were created
+        ScanResult.id
+    ).offset(offset).limit(limit).all()
     
     return results
 
 
 @router.get("/{project_id}/scores", response_model=List[VisibilityScoreResponse])
-async def get_visibility_scores(
+def get_visibility_scores(
     project_id: str,
     days: int = 30,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get historical visibility scores for a project"""
-    project = get_user_project(project_id, user, db)
+    ensure_user_project(project_id, user, db)
     
     since = datetime.utcnow() - timedelta(days=days)
     
-    scores = db.query(VisibilityScore).filter(
-        VisibilityScore.project_id == project.id,
+    # Plain column tuples: the response is read-only, so skip ORM identity
+    # map bookkeeping and the columns VisibilityScoreResponse doesn't expose
+    scores = db.query(
+        VisibilityScore.id,
+        VisibilityScore.date,
+        VisibilityScore.overall_score,
+        VisibilityScore.provider_scores,
+        VisibilityScore.total_prompts_tested,
+        VisibilityScore.prompts_with_mention,
+        VisibilityScore.mention_rate,
+        VisibilityScore.score_change,
+        VisibilityScore.score_trend
+    ).filter(
+        VisibilityScore.project_id == project_id,
         VisibilityScore.date >= since
     ).order_by(VisibilityScore.date.desc()).all()
     
@@ -356,8 +426,6 @@ async def get_visibility_scores(
 # Background task
 async def run_scan_task(scan_id: str, db: Session):
     """Run scan in background"""
-    from ..services.scanner import ScannerService
-    
     scanner = ScannerService(db)
     await scanner.execute_scan(scan_id)
 
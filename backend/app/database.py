@@ -3,6 +3,11 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import get_settings
 import logging
+import os
+import threading
+import time
+import uuid
+import orjson
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -12,12 +17,20 @@ _engine = None
 _SessionLocal = None
 Base = declarative_base()
 
+def _json_serializer(obj) -> str:
+    """Encode JSON columns with orjson (psycopg2 expects str, not bytes)"""
+    return orjson.dumps(obj).decode()
+
 def get_engine():
     """Get or create database engine (lazy initialization)"""
     global _engine
     if _engine is None:
         logger.info(f"Creating database engine for: {settings.DATABASE_URL[:20]}...")
-        _engine = create_engine(settings.DATABASE_URL)
+        _engine = create_engine(
+            settings.DATABASE_URL,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads
+        )
     return _engine
 
 def get_session_local():
@@ -27,6 +40,41 @@ def get_session_local():
         _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
     return _SessionLocal
 
+_id_lock = threading.Lock()
+_id_last_ms = 0
+_id_counter = 0
+
+def generate_id() -> str:
+    """
+    Generate a time-ordered UUIDv7 string for primary keys.
+    
+    The leading 48 bits are a millisecond timestamp, so new rows land on the
+    right-most B-tree page instead of a random one (as with uuid4). rand_a
+    holds a counter (RFC 9562 method 1), so ids generated within the same
+    millisecond in this process still sort in creation order.
+    """
+    global _id_last_ms, _id_counter
+    rand = int.from_bytes(os.urandom(8), "big")
+    with _id_lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms > _id_last_ms:
+            # Random start with headroom so the counter rarely overflows
+            _id_last_ms = timestamp_ms
+            _id_counter = rand >> 53  # 11 random bits
+        else:
+            # Same millisecond (or clock moved back): keep counting
+            _id_counter += 1
+            if _id_counter > 0xFFF:
+                _id_last_ms += 1
+                _id_counter = 0
+        timestamp_ms, counter = _id_last_ms, _id_counter
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= counter << 64  # rand_a
+    value |= 0b10 << 62  # variant
+    value |= rand & ((1 << 62) - 1)  # rand_b
+    return str(uuid.UUID(int=value))
+
 def get_db():
     """Dependency for FastAPI endpoints that need database access"""
     SessionLocal = get_session_local()
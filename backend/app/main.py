@@ -4,20 +4,29 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 import logging
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from .config import get_settings
 from .api import auth
+from .services.http_client import close_http_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release pooled outbound connections
+    await close_http_client()
+
 app = FastAPI(
     title="AI Prompt Tracker API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 settings = get_settings()
@@ -29,6 +38,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count"],  # Paginated scan results
 )
 
 # NO-CACHE Middleware - Disable all caching for development
@@ -55,6 +65,16 @@ async def health_check():
 # Serve landing page at root
 landing_dir = Path(__file__).parent.parent.parent / "landing"
 
+VIDEO_SUFFIXES = frozenset({'.mp4', '.webm', '.mov'})
+IMAGE_MEDIA_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.svg': 'image/svg+xml',
+    '.webp': 'image/webp'
+}
+
 @app.get("/")
 async def landing_page():
     """Serve landing page"""
@@ -100,7 +120,7 @@ async def bing_auth():
 async def serve_video(video_name: str):
     """Serve video files from landing/videos directory"""
     video_file = landing_dir / "videos" / video_name
-    if video_file.exists() and video_file.suffix in ['.mp4', '.webm', '.mov']:
+    if video_file.exists() and video_file.suffix in VIDEO_SUFFIXES:
         return FileResponse(video_file, media_type="video/mp4")
     return {"error": "Video not found"}
 
@@ -108,15 +128,8 @@ async def serve_video(video_name: str):
 async def serve_image(image_name: str):
     """Serve image files from landing/images directory"""
     image_file = landing_dir / "images" / image_name
-    if image_file.exists() and image_file.suffix.lower() in ['.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp']:
-        media_type = {
-            '.png': 'image/png',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.gif': 'image/gif',
-            '.svg': 'image/svg+xml',
-            '.webp': 'image/webp'
-        }.get(image_file.suffix.lower(), 'image/png')
+    media_type = IMAGE_MEDIA_TYPES.get(image_file.suffix.lower())
+    if media_type and image_file.exists():
         return FileResponse(image_file, media_type=media_type)
     return {"error": "Image not found"}
 
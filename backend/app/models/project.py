@@ -2,7 +2,7 @@
 Project models for tracking brand visibility across LLMs
 """
 
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, Text, ForeignKey, JSON, Float
+from sqlalchemy import Column, String, DateTime, Boolean, Integer, Text, ForeignKey, JSON, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..database import Base
@@ -49,9 +49,13 @@ class Project(Base):
 class Scan(Base):
     """A single scan run across all configured LLM providers"""
     __tablename__ = "scans"
+    __table_args__ = (
+        # Serves "latest scans for a project" without a sort step
+        Index("ix_scans_project_id_created_at", "project_id", "created_at"),
+    )
     
     id = Column(String, primary_key=True)
-    project_id = Column(String, ForeignKey("projects.id"), nullable=False, index=True)
+    project_id = Column(String, ForeignKey("projects.id"), nullable=False)
     
     # Scan metadata
     scan_type = Column(String, default="full")  # full, quick, custom
@@ -120,9 +124,13 @@ class ScanResult(Base):
 class VisibilityScore(Base):
     """Daily/historical visibility scores for a project"""
     __tablename__ = "visibility_scores"
+    __table_args__ = (
+        # Serves score history range queries per project
+        Index("ix_visibility_scores_project_id_date", "project_id", "date"),
+    )
     
     id = Column(String, primary_key=True)
-    project_id = Column(String, ForeignKey("projects.id"), nullable=False, index=True)
+    project_id = Column(String, ForeignKey("projects.id"), nullable=False)
     
     # Date of score
     date = Column(DateTime(timezone=True), nullable=False, index=True)
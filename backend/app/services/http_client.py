@@ -0,0 +1,42 @@
+"""
+Shared outbound HTTP client.
+
+One pooled AsyncClient is reused by every service so keep-alive
+connections (and their TLS sessions) survive across requests.
+
+The client is shared by all users and also fetches arbitrary third-party
+sites, so its cookie jar rejects every cookie: a Set-Cookie from a site one
+user crawls must never be replayed on another user's request.
+"""
+
+import http.cookiejar
+import httpx
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Lazy initialization - don't create the client on import
+_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared AsyncClient"""
+    global _client
+    if _client is None or _client.is_closed:
+        logger.info("Creating shared HTTP client")
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            cookies=http.cookiejar.CookieJar(
+                policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
+    return _client
+
+
+async def close_http_client():
+    """Close the shared client (called on application shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
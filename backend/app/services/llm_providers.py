@@ -8,12 +8,21 @@ that can be analyzed for brand mentions.
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import re
 
+from .http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _term_pattern(term: str) -> re.Pattern:
+    """Compiled case-insensitive pattern for a brand term, reused across results"""
+    return re.compile(re.escape(term), re.IGNORECASE)
+
+
 @dataclass
 class LLMResponse:
     """Standardized response from any LLM provider"""
@@ -56,8 +65,14 @@ class OpenAIProvider(BaseLLMProvider):
         super().__init__(api_key)
         self.model = model
         try:
-            from openai import AsyncOpenAI
-            self.client = AsyncOpenAI(api_key=api_key)
+            from openai import AsyncOpenAI, DEFAULT_TIMEOUT
+            # The SDK adopts a custom http_client's (30s) timeout unless one
+            # is given, so keep its own default for slow completions
+            self.client = AsyncOpenAI(
+                api_key=api_key,
+                http_client=get_http_client(),
+                timeout=DEFAULT_TIMEOUT
+            )
         except ImportError:
             raise ImportError("openai package is required. Install with: pip install openai")
     
@@ -178,12 +193,22 @@ class BrandMentionAnalyzer:
                 'context_snippets': List[str]
             }
         """
-        text_lower = text.lower()
         found = False
         mentions = []
         positions = []
         context_snippets = []
         
+        # Failed queries come back with empty text - nothing to search
+        if not text or not brand_terms:
+            return {
+                'found': found,
+                'mentions': mentions,
+                'positions': positions,
+                'context_snippets': context_snippets
+            }
+        
+        text_lower = text.lower()
+        
         for term in brand_terms:
             term_lower = term.lower()
             if term_lower in text_lower:
@@ -191,8 +216,7 @@ class BrandMentionAnalyzer:
                 mentions.append(term)
                 
                 # Find all occurrences
-                pattern = re.compile(re.escape(term_lower), re.IGNORECASE)
-                for match in pattern.finditer(text):
+                for match in _term_pattern(term_lower).finditer(text):
                     positions.append(match.start())
                     
                     # Extract context (50 chars before and after)
@@ -217,10 +241,14 @@ class BrandMentionAnalyzer:
         Returns:
             Rank (1-based) or None if not found
         """
+        if not text or not brand_terms:
+            return None
+        
         if not competitor_terms:
             competitor_terms = []
         
         all_terms = brand_terms + competitor_terms
+        brand_set = set(brand_terms)
         mentions = []
         
         text_lower = text.lower()
@@ -228,7 +256,7 @@ class BrandMentionAnalyzer:
             term_lower = term.lower()
             pos = text_lower.find(term_lower)
             if pos != -1:
-                is_brand = term in brand_terms
+                is_brand = term in brand_set
                 mentions.append((pos, term, is_brand))
         
         # Sort by position
@@ -280,6 +308,11 @@ class PromptTemplateManager:
         """
         prompts = []
         
+        # Drop repeated keywords/use cases (order-preserving) so each prompt
+        # is only sent to the providers once
+        keywords = list(dict.fromkeys(keywords)) if keywords else keywords
+        use_cases = list(dict.fromkeys(use_cases)) if use_cases else use_cases
+        
         # Brand awareness prompts
         for template in cls.TEMPLATES['brand_awareness']:
             prompts.append({
@@ -1,3 +1,4 @@
+import json
 import logging
 import re
 import asyncio
@@ -23,11 +24,9 @@ class LLMService:
         """Lazy initialization of the OpenAI client"""
         if self._client is None:
             try:
-                from ..config import get_settings
                 settings = get_settings()
                 api_key = getattr(settings, 'GROQ_API_KEY', None)
                 if api_key and api_key.strip():
-                    from openai import AsyncOpenAI
                     self._client = AsyncOpenAI(
                         api_key=api_key,
                         base_url="https://api.groq.com/openai/v1"
@@ -377,7 +376,6 @@ CRITICAL: Extract domain without http://, https://, or www. prefixes. Just the d
                 return None
             
             # Parse JSON response
-            import json
             intent = json.loads(result)
             logger.info(f"✅ LLM detected backlink intent: {intent.get('action')} for domain(s)")
             return intent
@@ -425,14 +423,16 @@ CRITICAL: Extract domain without http://, https://, or www. prefixes. Just the d
         
         # Add user projects context if available
         if user_projects:
-            projects_context = f"\n\n[USER'S EXISTING PROJECTS]\n"
-            projects_context += f"The user has {len(user_projects)} project(s):\n"
+            context_parts = [
+                f"\n\n[USER'S EXISTING PROJECTS]\n",
+                f"The user has {len(user_projects)} project(s):\n",
+            ]
             for project in user_projects:
-                projects_context += f"- {project['name']} ({project['target_url']}) [ID: {project['id']}]\n"
+                context_parts.append(f"- {project['name']} ({project['target_url']}) [ID: {project['id']}]\n")
                 if project['tracked_keywords']:
-                    projects_context += f"  Tracking: {', '.join([kw['keyword'] for kw in project['tracked_keywords'][:3]])}\n"
+                    context_parts.append(f"  Tracking: {', '.join([kw['keyword'] for kw in project['tracked_keywords'][:3]])}\n")
             
-            user_message = user_message + projects_context
+            user_message = user_message + "".join(context_parts)
         
         messages.append({"role": "user", "content": user_message})
         
@@ -465,7 +465,6 @@ CRITICAL: Extract domain without http://, https://, or www. prefixes. Just the d
                     logger.info(f"🛠️  LLM requested {len(message.tool_calls)} tool calls")
                     tool_calls = []
                     for tool_call in message.tool_calls:
-                        import json
                         tool_calls.append({
                             "id": tool_call.id,
                             "name": tool_call.function.name,
@@ -570,7 +569,6 @@ CRITICAL: Extract domain without http://, https://, or www. prefixes. Just the d
     
     def _extract_reasoning(self, full_response: str) -> tuple[str, Optional[str]]:
         """Extract reasoning from response and return (reasoning, content)"""
-        import re
         
         # Look for <reasoning>...</reasoning> tags (properly closed)
         reasoning_pattern = r'<reasoning>(.*?)</reasoning>'
@@ -1035,92 +1033,92 @@ When user requests content (e.g., "Write an article about SEO tips"):
         keyword_error: Optional[str] = None
     ) -> str:
         """Build user content with all available data"""
-        user_content = user_message
+        parts = [user_message]
         
         if user_projects:
-            user_content += f"\n\n[USER'S EXISTING PROJECTS - CONTEXT ONLY]\n"
-            user_content += f"The user has {len(user_projects)} project(s):\n\n"
+            parts.append(f"\n\n[USER'S EXISTING PROJECTS - CONTEXT ONLY]\n")
+            parts.append(f"The user has {len(user_projects)} project(s):\n\n")
             
             for project in user_projects:
-                user_content += f"- {project['name'] or 'Unnamed'} ({project['target_url']})\n"
+                parts.append(f"- {project['name'] or 'Unnamed'} ({project['target_url']})\n")
                 if project['tracked_keywords']:
-                    user_content += f"  Tracking: {', '.join([kw['keyword'] for kw in project['tracked_keywords'][:3]])}\n"
-                user_content += "\n"
+                    parts.append(f"  Tracking: {', '.join([kw['keyword'] for kw in project['tracked_keywords'][:3]])}\n")
+                parts.append("\n")
         
         if website_data:
             if 'error' in website_data:
                 # Provide clear error context to the LLM
                 error_msg = website_data['error']
-                user_content += f"\n\n[WEBSITE FETCH FAILED for {website_data['url']}]"
-                user_content += f"\nError Type: {error_msg}"
+                parts.append(f"\n\n[WEBSITE FETCH FAILED for {website_data['url']}]")
+                parts.append(f"\nError Type: {error_msg}")
                 
                 # Give helpful hints based on error type
                 if 'nodename' in error_msg or 'DNS' in error_msg or 'not known' in error_msg:
-                    user_content += "\nLikely Reason: Domain doesn't exist or isn't live yet"
-                    user_content += "\nSuggestion: Ask the user if the site is deployed, or request them to describe what it offers"
+                    parts.append("\nLikely Reason: Domain doesn't exist or isn't live yet")
+                    parts.append("\nSuggestion: Ask the user if the site is deployed, or request them to describe what it offers")
                 elif 'timeout' in error_msg.lower():
-                    user_content += "\nLikely Reason: Site took too long to respond"
-                    user_content += "\nSuggestion: The site may be slow or down. Ask for alternative information."
+                    parts.append("\nLikely Reason: Site took too long to respond")
+                    parts.append("\nSuggestion: The site may be slow or down. Ask for alternative information.")
                 elif 'HTTP' in error_msg:
-                    user_content += "\nLikely Reason: Server returned an error"
-                    user_content += "\nSuggestion: Site may be private or restricted. Ask the user for details."
+                    parts.append("\nLikely Reason: Server returned an error")
+                    parts.append("\nSuggestion: Site may be private or restricted. Ask the user for details.")
                 else:
-                    user_content += "\nSuggestion: Unable to access the website. Ask the user to describe their business/product instead."
+                    parts.append("\nSuggestion: Unable to access the website. Ask the user to describe their business/product instead.")
                 
-                user_content += "\n\nIMPORTANT: You DO have website scraping capability. This specific site just failed to load. Don't claim you can't browse - you can, this particular fetch just didn't work.\n"
+                parts.append("\n\nIMPORTANT: You DO have website scraping capability. This specific site just failed to load. Don't claim you can't browse - you can, this particular fetch just didn't work.\n")
             else:
                 analysis_type = website_data.get('analysis_type', 'single_page')
                 
                 if analysis_type == 'full_site':
                     # Multi-page analysis
-                    user_content += f"\n\n[FULL SITE ANALYSIS COMPLETED for {website_data['url']}]\n"
-                    user_content += f"Pages Analyzed: {website_data.get('pages_analyzed', 1)}\n"
-                    user_content += f"Sitemap Found: {'Yes' if website_data.get('sitemap_found') else 'No'}\n"
+                    parts.append(f"\n\n[FULL SITE ANALYSIS COMPLETED for {website_data['url']}]\n")
+                    parts.append(f"Pages Analyzed: {website_data.get('pages_analyzed', 1)}\n")
+                    parts.append(f"Sitemap Found: {'Yes' if website_data.get('sitemap_found') else 'No'}\n")
                     if website_data.get('sitemap_found'):
-                        user_content += f"Total URLs in Sitemap: {website_data.get('total_sitemap_urls', 0)}\n"
+                        parts.append(f"Total URLs in Sitemap: {website_data.get('total_sitemap_urls', 0)}\n")
                     
-                    user_content += f"\nMain Page:\n"
-                    user_content += f"- Title: {website_data.get('title', 'N/A')}\n"
-                    user_content += f"- Meta Description: {website_data.get('meta_description', 'N/A')}\n"
+                    parts.append(f"\nMain Page:\n")
+                    parts.append(f"- Title: {website_data.get('title', 'N/A')}\n")
+                    parts.append(f"- Meta Description: {website_data.get('meta_description', 'N/A')}\n")
                     if website_data.get('meta_keywords'):
-                        user_content += f"- Meta Keywords: {website_data['meta_keywords']}\n"
+                        parts.append(f"- Meta Keywords: {website_data['meta_keywords']}\n")
                     
-                    user_content += f"\nAll Page Titles Across Site:\n"
+                    parts.append(f"\nAll Page Titles Across Site:\n")
                     for title in website_data.get('all_page_titles', [])[:10]:
-                        user_content += f"  - {title}\n"
+                        parts.append(f"  - {title}\n")
                     
-                    user_content += f"\nAll H1 Headings Across Site:\n"
+                    parts.append(f"\nAll H1 Headings Across Site:\n")
                     for h1 in website_data.get('all_h1_headings', [])[:10]:
-                        user_content += f"  - {h1}\n"
+                        parts.append(f"  - {h1}\n")
                     
-                    user_content += f"\nKey H2 Headings:\n"
+                    parts.append(f"\nKey H2 Headings:\n")
                     for h2 in website_data.get('all_h2_headings', [])[:10]:
-                        user_content += f"  - {h2}\n"
+                        parts.append(f"  - {h2}\n")
                     
-                    user_content += f"\nMain Content Preview: {website_data.get('main_content_preview', '')}\n"
+                    parts.append(f"\nMain Content Preview: {website_data.get('main_content_preview', '')}\n")
                     
                 else:
                     # Single page fallback
-                    user_content += f"\n\n[WEBSITE ANALYSIS SUCCESSFUL for {website_data['url']}]\n"
-                    user_content += f"Title: {website_data.get('title', 'N/A')}\n"
-                    user_content += f"Meta Description: {website_data.get('meta_description', 'N/A')}\n"
+                    parts.append(f"\n\n[WEBSITE ANALYSIS SUCCESSFUL for {website_data['url']}]\n")
+                    parts.append(f"Title: {website_data.get('title', 'N/A')}\n")
+                    parts.append(f"Meta Description: {website_data.get('meta_description', 'N/A')}\n")
                     if website_data.get('meta_keywords'):
-                        user_content += f"Meta Keywords: {website_data['meta_keywords']}\n"
+                        parts.append(f"Meta Keywords: {website_data['meta_keywords']}\n")
                     
                     headings = website_data.get('headings', {})
                     if headings:
-                        user_content += f"H1 Headings: {headings.get('h1', [])}\n"
-                        user_content += f"H2 Headings: {headings.get('h2', [])[:5]}\n"
+                        parts.append(f"H1 Headings: {headings.get('h1', [])}\n")
+                        parts.append(f"H2 Headings: {headings.get('h2', [])[:5]}\n")
                     
-                    user_content += f"Content Preview: {website_data.get('main_content', '')[:500]}\n"
+                    parts.append(f"Content Preview: {website_data.get('main_content', '')[:500]}\n")
         
         # Handle keyword API errors
         if keyword_error:
-            user_content += f"\n\n[KEYWORD RESEARCH API ERROR]\n"
-            user_content += f"Error: {keyword_error}\n"
-            user_content += f"The keyword research API failed. Inform the user about this issue clearly.\n"
-            user_content += f"Do NOT make up any keyword data. Apologize and explain the API is currently unavailable.\n"
-            user_content += f"Suggest they try again later or contact support if the issue persists.\n"
+            parts.append(f"\n\n[KEYWORD RESEARCH API ERROR]\n")
+            parts.append(f"Error: {keyword_error}\n")
+            parts.append(f"The keyword research API failed. Inform the user about this issue clearly.\n")
+            parts.append(f"Do NOT make up any keyword data. Apologize and explain the API is currently unavailable.\n")
+            parts.append(f"Suggest they try again later or contact support if the issue persists.\n")
         elif keyword_data:
             # Provide keyword data summary for LLM analysis
             # Sort by search volume to highlight top opportunities
@@ -1130,101 +1128,101 @@ When user requests content (e.g., "Write an article about SEO tips"):
             # Get top 3-5 for bullet point highlights
             top_keywords = sorted_keywords[:5]
             
-            user_content += f"\n\n[KEYWORD RESEARCH RESULTS]\n\n"
-            user_content += f"Found {total_count} keywords. Top opportunities:\n\n"
+            parts.append(f"\n\n[KEYWORD RESEARCH RESULTS]\n\n")
+            parts.append(f"Found {total_count} keywords. Top opportunities:\n\n")
             
             for kw in top_keywords:
                 keyword = kw.get('keyword', 'N/A')
                 volume = f"{kw.get('search_volume', 0):,}"
                 ad_comp = kw.get('ad_competition', 'N/A')
                 seo_diff = kw.get('seo_difficulty', 'N/A')
-                user_content += f"- {keyword}: {volume}/mo, Ad Comp: {ad_comp}, SEO Diff: {seo_diff}\n"
+                parts.append(f"- {keyword}: {volume}/mo, Ad Comp: {ad_comp}, SEO Diff: {seo_diff}\n")
             
-            user_content += f"\n🚨 CRITICAL INSTRUCTION:\n"
-            user_content += f"- DO NOT show an ASCII table in your response\n"
-            user_content += f"- Present 3-5 top opportunities as bullet points\n"
-            user_content += f"- Include brief analysis (1-2 sentences)\n"
-            user_content += f"- End with: '📊 View all {total_count} keywords in the interactive table →'\n\n"
-            user_content += f"Focus your analysis on:\n"
-            user_content += f"1. SEO Difficulty scores (60-100 = very hard, 30-60 = moderate, 0-30 = easy)\n"
-            user_content += f"2. Which keywords have best opportunity (high volume + lower SEO difficulty)\n"
-            user_content += f"3. Strategic recommendations for targeting\n\n"
-            user_content += f"Full dataset available in side panel - user can sort, filter, and export there.\n"
+            parts.append(f"\n🚨 CRITICAL INSTRUCTION:\n")
+            parts.append(f"- DO NOT show an ASCII table in your response\n")
+            parts.append(f"- Present 3-5 top opportunities as bullet points\n")
+            parts.append(f"- Include brief analysis (1-2 sentences)\n")
+            parts.append(f"- End with: '📊 View all {total_count} keywords in the interactive table →'\n\n")
+            parts.append(f"Focus your analysis on:\n")
+            parts.append(f"1. SEO Difficulty scores (60-100 = very hard, 30-60 = moderate, 0-30 = easy)\n")
+            parts.append(f"2. Which keywords have best opportunity (high volume + lower SEO difficulty)\n")
+            parts.append(f"3. Strategic recommendations for targeting\n\n")
+            parts.append(f"Full dataset available in side panel - user can sort, filter, and export there.\n")
         else:
-            user_content += f"\n\n[NO KEYWORD DATA AVAILABLE]\n"
+            parts.append(f"\n\n[NO KEYWORD DATA AVAILABLE]\n")
             
             if website_data and 'error' not in website_data:
                 # Have website data, can provide analysis
-                user_content += f"You have comprehensive website data above. Provide keyword analysis:\n"
-                user_content += f"1. Analyze what the business does based on the page content\n"
-                user_content += f"2. Suggest specific keyword themes and directions they should target\n"
-                user_content += f"3. Explain why those keywords are relevant based on the site analysis\n"
-                user_content += f"4. Offer to fetch real search volume data for specific keywords\n"
+                parts.append(f"You have comprehensive website data above. Provide keyword analysis:\n")
+                parts.append(f"1. Analyze what the business does based on the page content\n")
+                parts.append(f"2. Suggest specific keyword themes and directions they should target\n")
+                parts.append(f"3. Explain why those keywords are relevant based on the site analysis\n")
+                parts.append(f"4. Offer to fetch real search volume data for specific keywords\n")
             else:
                 # No website data either
                 # Check if user seems to want keyword research
                 message_lower = user_message.lower()
                 if any(word in message_lower for word in ['keyword', 'research', 'seo', 'rank', 'search volume']):
-                    user_content += f"User requested keyword research but didn't specify a topic/niche.\n"
-                    user_content += f"You need to know what topic to research before you can fetch data.\n"
+                    parts.append(f"User requested keyword research but didn't specify a topic/niche.\n")
+                    parts.append(f"You need to know what topic to research before you can fetch data.\n")
                 else:
-                    user_content += f"No specific keyword research request detected.\n"
-                    user_content += f"Respond to their query naturally.\n"
+                    parts.append(f"No specific keyword research request detected.\n")
+                    parts.append(f"Respond to their query naturally.\n")
             
-            user_content += f"\nDo NOT make up search volumes or competition levels. You can suggest keywords to research.\n"
+            parts.append(f"\nDo NOT make up search volumes or competition levels. You can suggest keywords to research.\n")
         
         # Add backlink data if available (RapidAPI format)
         if backlink_data:
             if backlink_data.get('error'):
-                user_content += f"\n\n[BACKLINK ANALYSIS ERROR]\n"
-                user_content += f"Error: {backlink_data['error']}\n"
-                user_content += f"Inform the user about the limitation and suggest they can try again later.\n"
+                parts.append(f"\n\n[BACKLINK ANALYSIS ERROR]\n")
+                parts.append(f"Error: {backlink_data['error']}\n")
+                parts.append(f"Inform the user about the limitation and suggest they can try again later.\n")
             elif backlink_data.get('needs_domain'):
-                user_content += f"\n\n[BACKLINK ANALYSIS REQUESTED]\n"
-                user_content += f"User wants backlink analysis but didn't specify a domain.\n"
-                user_content += f"Ask them which domain they want to analyze (e.g., 'keywords.chat' or 'example.com').\n"
+                parts.append(f"\n\n[BACKLINK ANALYSIS REQUESTED]\n")
+                parts.append(f"User wants backlink analysis but didn't specify a domain.\n")
+                parts.append(f"Ask them which domain they want to analyze (e.g., 'keywords.chat' or 'example.com').\n")
             elif backlink_data.get('link_gaps'):
                 # This is a comparison result
-                user_content += f"\n\n[BACKLINK COMPARISON COMPLETED]\n"
-                user_content += f"Comparing: {backlink_data.get('my_domain')} vs {backlink_data.get('competitor_domain')}\n"
-                user_content += f"Your domain:\n"
-                user_content += f"  - Total backlinks: {backlink_data.get('my_backlinks_count', 0)}\n"
-                user_content += f"  - Referring domains: {backlink_data.get('my_referring_domains', 0)}\n"
-                user_content += f"Competitor domain:\n"
-                user_content += f"  - Total backlinks: {backlink_data.get('competitor_backlinks_count', 0)}\n"
-                user_content += f"  - Referring domains: {backlink_data.get('competitor_referring_domains', 0)}\n"
-                user_content += f"\nLink gap opportunities found: {backlink_data.get('gap_count', 0)}\n\n"
+                parts.append(f"\n\n[BACKLINK COMPARISON COMPLETED]\n")
+                parts.append(f"Comparing: {backlink_data.get('my_domain')} vs {backlink_data.get('competitor_domain')}\n")
+                parts.append(f"Your domain:\n")
+                parts.append(f"  - Total backlinks: {backlink_data.get('my_backlinks_count', 0)}\n")
+                parts.append(f"  - Referring domains: {backlink_data.get('my_referring_domains', 0)}\n")
+                parts.append(f"Competitor domain:\n")
+                parts.append(f"  - Total backlinks: {backlink_data.get('competitor_backlinks_count', 0)}\n")
+                parts.append(f"  - Referring domains: {backlink_data.get('competitor_referring_domains', 0)}\n")
+                parts.append(f"\nLink gap opportunities found: {backlink_data.get('gap_count', 0)}\n\n")
                 
                 if backlink_data.get('link_gaps'):
-                    user_content += f"Top opportunities (sites linking to competitor but not you):\n"
+                    parts.append(f"Top opportunities (sites linking to competitor but not you):\n")
                     for gap in backlink_data['link_gaps'][:15]:
-                        user_content += f"- {gap.get('url_from')}\n"
-                        user_content += f"  → Links to: {gap.get('url_to')}\n"
-                        user_content += f"  Link Quality: {gap.get('inlink_rank', 'N/A')}, Domain Quality: {gap.get('domain_inlink_rank', 'N/A')}\n"
-                        user_content += f"  Spam Score: {gap.get('spam_score', 'N/A')}\n"
-                        user_content += f"  Anchor: \"{gap.get('anchor', 'N/A')}\"\n"
-                        user_content += f"  Nofollow: {gap.get('nofollow', False)}\n"
-                        user_content += f"  First seen: {gap.get('first_seen', 'N/A')}\n\n"
+                        parts.append(f"- {gap.get('url_from')}\n")
+                        parts.append(f"  → Links to: {gap.get('url_to')}\n")
+                        parts.append(f"  Link Quality: {gap.get('inlink_rank', 'N/A')}, Domain Quality: {gap.get('domain_inlink_rank', 'N/A')}\n")
+                        parts.append(f"  Spam Score: {gap.get('spam_score', 'N/A')}\n")
+                        parts.append(f"  Anchor: \"{gap.get('anchor', 'N/A')}\"\n")
+                        parts.append(f"  Nofollow: {gap.get('nofollow', False)}\n")
+                        parts.append(f"  First seen: {gap.get('first_seen', 'N/A')}\n\n")
                 
-                user_content += f"\nProvide actionable insights about:\n"
-                user_content += f"1. Which link opportunities are most valuable (high inlink_rank/domain_inlink_rank, low spam, dofollow)\n"
-                user_content += f"2. How the user can approach these sites for links\n"
-                user_content += f"3. Overall backlink strategy recommendations\n"
+                parts.append(f"\nProvide actionable insights about:\n")
+                parts.append(f"1. Which link opportunities are most valuable (high inlink_rank/domain_inlink_rank, low spam, dofollow)\n")
+                parts.append(f"2. How the user can approach these sites for links\n")
+                parts.append(f"3. Overall backlink strategy recommendations\n")
             else:
                 # Regular backlink analysis
-                user_content += f"\n\n[BACKLINK ANALYSIS COMPLETED]\n"
-                user_content += f"Domain: {backlink_data.get('target')}\n"
-                user_content += f"Total backlinks: {backlink_data.get('total_backlinks', 0)}\n"
-                user_content += f"Referring domains: {backlink_data.get('referring_domains', 0)}\n"
-                user_content += f"Domain Authority: {backlink_data.get('domain_authority', 'N/A')}\n\n"
+                parts.append(f"\n\n[BACKLINK ANALYSIS COMPLETED]\n")
+                parts.append(f"Domain: {backlink_data.get('target')}\n")
+                parts.append(f"Total backlinks: {backlink_data.get('total_backlinks', 0)}\n")
+                parts.append(f"Referring domains: {backlink_data.get('referring_domains', 0)}\n")
+                parts.append(f"Domain Authority: {backlink_data.get('domain_authority', 'N/A')}\n\n")
                 
                 # Show historical trend if available
                 overtime = backlink_data.get('overtime', [])
                 if overtime and len(overtime) > 1:
-                    user_content += f"Backlink Growth Trend (last {len(overtime)} months):\n"
+                    parts.append(f"Backlink Growth Trend (last {len(overtime)} months):\n")
                     for month_data in overtime[:4]:  # Show last 4 months
-                        user_content += f"  {month_data.get('date')}: {month_data.get('backlinks')} backlinks, {month_data.get('refdomains')} domains, DA {month_data.get('da')}\n"
-                    user_content += "\n"
+                        parts.append(f"  {month_data.get('date')}: {month_data.get('backlinks')} backlinks, {month_data.get('refdomains')} domains, DA {month_data.get('da')}\n")
+                    parts.append("\n")
                 
                 # Show new/lost backlinks
                 new_and_lost = backlink_data.get('new_and_lost', [])
@@ -1232,31 +1230,31 @@ When user requests content (e.g., "Write an article about SEO tips"):
                     recent_changes = new_and_lost[:7]  # Last 7 days
                     total_new = sum(day.get('new', 0) for day in recent_changes)
                     total_lost = sum(day.get('lost', 0) for day in recent_changes)
-                    user_content += f"Recent Activity (last 7 days): +{total_new} new, -{total_lost} lost\n\n"
+                    parts.append(f"Recent Activity (last 7 days): +{total_new} new, -{total_lost} lost\n\n")
                 
                 if backlink_data.get('backlinks'):
-                    user_content += f"Top backlinks (showing 15):\n"
+                    parts.append(f"Top backlinks (showing 15):\n")
                     for i, link in enumerate(backlink_data['backlinks'][:15], 1):
-                        user_content += f"{i}. {link.get('url_from')}\n"
-                        user_content += f"   → {link.get('url_to')}\n"
-                        user_content += f"   Link Quality: {link.get('inlink_rank', 'N/A')}, Domain Quality: {link.get('domain_inlink_rank', 'N/A')}\n"
-                        user_content += f"   Spam: {link.get('spam_score', 'N/A')}, Nofollow: {link.get('nofollow', False)}\n"
-                        user_content += f"   Anchor: \"{link.get('anchor', 'N/A')}\"\n"
-                        user_content += f"   Page Title: {link.get('title', 'N/A')[:80]}\n\n"
+                        parts.append(f"{i}. {link.get('url_from')}\n")
+                        parts.append(f"   → {link.get('url_to')}\n")
+                        parts.append(f"   Link Quality: {link.get('inlink_rank', 'N/A')}, Domain Quality: {link.get('domain_inlink_rank', 'N/A')}\n")
+                        parts.append(f"   Spam: {link.get('spam_score', 'N/A')}, Nofollow: {link.get('nofollow', False)}\n")
+                        parts.append(f"   Anchor: \"{link.get('anchor', 'N/A')}\"\n")
+                        parts.append(f"   Page Title: {link.get('title', 'N/A')[:80]}\n\n")
                 
                 # Show anchor text distribution
                 anchors = backlink_data.get('anchors', [])
                 if anchors:
-                    user_content += f"Top anchor texts used:\n"
+                    parts.append(f"Top anchor texts used:\n")
                     for anchor_data in anchors[:10]:
-                        user_content += f"  - \"{anchor_data.get('anchor_text')}\" ({anchor_data.get('external_pages', 0)} pages from {anchor_data.get('external_root_domains', 0)} domains)\n"
-                    user_content += "\n"
+                        parts.append(f"  - \"{anchor_data.get('anchor_text')}\" ({anchor_data.get('external_pages', 0)} pages from {anchor_data.get('external_root_domains', 0)} domains)\n")
+                    parts.append("\n")
                 
-                user_content += f"\nProvide insights about:\n"
-                user_content += f"1. Overall backlink profile quality (looking at inlink ranks, spam scores, dofollow ratio)\n"
-                user_content += f"2. Anchor text diversity and naturalness\n"
-                user_content += f"3. Growth trend and recent activity\n"
-                user_content += f"4. Recommendations for improving backlink strategy\n"
+                parts.append(f"\nProvide insights about:\n")
+                parts.append(f"1. Overall backlink profile quality (looking at inlink ranks, spam scores, dofollow ratio)\n")
+                parts.append(f"2. Anchor text diversity and naturalness\n")
+                parts.append(f"3. Growth trend and recent activity\n")
+                parts.append(f"4. Recommendations for improving backlink strategy\n")
         
-        return user_content
+        return "".join(parts)
 
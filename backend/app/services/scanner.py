@@ -2,11 +2,12 @@
 Scanner service for executing brand visibility scans across LLM providers
 """
 
-import uuid
+import asyncio
 import logging
+from collections import Counter
 from datetime import datetime
 from typing import List, Dict
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from ..models.project import Project, Scan, ScanResult, VisibilityScore
 from .llm_providers import (
@@ -16,6 +17,7 @@ from .llm_providers import (
     LLMResponse
 )
 from ..config import get_settings
+from ..database import generate_id
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -28,15 +30,19 @@ class ScannerService:
         self.db = db
         self.analyzer = BrandMentionAnalyzer()
         self.prompt_manager = PromptTemplateManager()
+        self.max_concurrent_queries = 5  # Per provider, to stay under rate limits
     
     async def execute_scan(self, scan_id: str):
         """Execute a complete scan"""
-        scan = self.db.query(Scan).filter(Scan.id == scan_id).first()
+        # Load the scan and its project in a single round-trip
+        scan = self.db.query(Scan).options(
+            joinedload(Scan.project)
+        ).filter(Scan.id == scan_id).first()
         if not scan:
             logger.error(f"Scan {scan_id} not found")
             return
         
-        project = self.db.query(Project).filter(Project.id == scan.project_id).first()
+        project = scan.project
         if not project:
             logger.error(f"Project {scan.project_id} not found")
             scan.status = "failed"
@@ -45,11 +51,6 @@ class ScannerService:
             return
         
         try:
-            # Update scan status
-            scan.status = "running"
-            scan.started_at = datetime.utcnow()
-            self.db.commit()
-            
             logger.info(f"Starting scan {scan_id} for project {project.name}")
             
             # Generate prompts
@@ -59,22 +60,44 @@ class ScannerService:
                 use_cases=project.use_cases
             )
             
+            # Update scan status and prompt count in a single commit
+            scan.status = "running"
+            scan.started_at = datetime.utcnow()
             scan.total_prompts = len(prompts) * len(scan.providers_checked)
             self.db.commit()
             
-            # Run prompts across all providers
+            # Run prompts across all providers concurrently - each provider
+            # is an independent upstream, so latency is the slowest one
+            provider_outcomes = await asyncio.gather(
+                *(
+                    self._scan_provider(project, scan, provider_name, prompts)
+                    for provider_name in scan.providers_checked
+                ),
+                return_exceptions=True
+            )
+            
             results = []
-            for provider_name in scan.providers_checked:
-                try:
-                    provider_results = await self._scan_provider(
-                        project, 
-                        scan, 
-                        provider_name, 
-                        prompts
-                    )
-                    results.extend(provider_results)
-                except Exception as e:
-                    logger.error(f"Error scanning provider {provider_name}: {str(e)}")
+            for provider_name, outcome in zip(scan.providers_checked, provider_outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Error scanning provider {provider_name}: {str(outcome)}")
+                    continue
+                results.extend(outcome)
+            
+            # One batched INSERT for all providers. Bulk-saved objects stay
+            # detached, so reading them while scoring never goes back to
+            # the database.
+            self.db.bulk_save_objects(results)
+            
+            # Nothing usable came back (no provider keys, upstream outage) -
+            # fail the scan rather than record a zero visibility score
+            if all(r.error for r in results):
+                scan.status = "failed"
+                scan.error_message = results[0].error if results else "No provider returned results"
+                scan.completed_at = datetime.utcnow()
+                scan.duration_seconds = (scan.completed_at - scan.started_at).total_seconds()
+                self.db.commit()
+                logger.error(f"Scan {scan_id} failed: every query returned an error")
+                return
             
             # Calculate summary
             prompts_with_mention = sum(1 for r in results if r.brand_found)
@@ -88,15 +111,17 @@ class ScannerService:
             # Update project
             project.last_scanned_at = scan.completed_at
             
-            self.db.commit()
-            
-            # Calculate and store visibility score
+            # Calculate visibility score, then commit results, scan status
+            # and score together
             await self._calculate_visibility_score(project, scan, results)
+            self.db.commit()
             
             logger.info(f"Scan {scan_id} completed successfully")
             
         except Exception as e:
             logger.error(f"Scan {scan_id} failed: {str(e)}")
+            # A failed flush/commit leaves the session unusable until rolled back
+            self.db.rollback()
             scan.status = "failed"
             scan.error_message = str(e)
             scan.completed_at = datetime.utcnow()
@@ -109,7 +134,7 @@ class ScannerService:
         provider_name: str,
         prompts: List[Dict]
     ) -> List[ScanResult]:
-        """Scan a single provider with all prompts"""
+        """Scan a single provider with all prompts (results are persisted by the caller)"""
         results = []
         
         try:
@@ -124,11 +149,23 @@ class ScannerService:
             
             logger.info(f"Scanning {len(prompts)} prompts with {provider_name}")
             
-            # Query each prompt
-            for prompt_data in prompts:
+            # Query prompts concurrently - they are independent network calls
+            semaphore = asyncio.Semaphore(self.max_concurrent_queries)
+            
+            async def query_prompt(prompt_data: Dict) -> LLMResponse:
+                async with semaphore:
+                    return await provider.query(prompt_data['prompt'])
+            
+            responses = await asyncio.gather(
+                *(query_prompt(prompt_data) for prompt_data in prompts),
+                return_exceptions=True
+            )
+            
+            # Analyze responses in prompt order
+            for prompt_data, response in zip(prompts, responses):
                 try:
-                    # Query LLM
-                    response: LLMResponse = await provider.query(prompt_data['prompt'])
+                    if isinstance(response, BaseException):
+                        raise response
                     
                     # Analyze response for brand mentions
                     mention_analysis = self.analyzer.find_brand_mentions(
@@ -147,7 +184,7 @@ class ScannerService:
                     
                     # Create result record
                     result = ScanResult(
-                        id=str(uuid.uuid4()),
+                        id=generate_id(),
                         scan_id=scan.id,
                         provider=response.provider,
                         model=response.model,
@@ -164,14 +201,13 @@ class ScannerService:
                         error=response.error
                     )
                     
-                    self.db.add(result)
                     results.append(result)
                     
                 except Exception as e:
                     logger.error(f"Error processing prompt: {str(e)}")
                     # Create error result
                     result = ScanResult(
-                        id=str(uuid.uuid4()),
+                        id=generate_id(),
                         scan_id=scan.id,
                         provider=provider_name,
                         model=provider.default_model,
@@ -182,11 +218,8 @@ class ScannerService:
                         brand_found=False,
                         error=str(e)
                     )
-                    self.db.add(result)
                     results.append(result)
             
-            self.db.commit()
-            
         except Exception as e:
             logger.error(f"Provider {provider_name} scan failed: {str(e)}")
         
@@ -198,34 +231,43 @@ class ScannerService:
         scan: Scan,
         results: List[ScanResult]
     ):
-        """Calculate overall visibility score from scan results"""
+        """Calculate overall visibility score from scan results (caller commits)"""
         
         if not results:
             return
         
+        # Per-provider counts, ranks and covered keywords in a single pass
+        provider_totals = Counter()
+        provider_mentions = Counter()
+        ranks = []
+        keywords_found = set()
+        for result in results:
+            provider_totals[result.provider] += 1
+            if result.mention_rank is not None:
+                ranks.append(result.mention_rank)
+            if result.brand_found:
+                provider_mentions[result.provider] += 1
+                keyword = result.prompt_metadata.get('keyword')
+                if keyword:
+                    keywords_found.add(keyword)
+        
         # Overall metrics
         total_prompts = len(results)
-        prompts_with_mention = sum(1 for r in results if r.brand_found)
+        prompts_with_mention = sum(provider_mentions.values())
         mention_rate = (prompts_with_mention / total_prompts * 100) if total_prompts > 0 else 0
         
         # Per-provider scores
         provider_scores = {}
         for provider_name in scan.providers_checked:
-            provider_results = [r for r in results if r.provider == provider_name]
-            if provider_results:
-                provider_mentions = sum(1 for r in provider_results if r.brand_found)
-                provider_score = (provider_mentions / len(provider_results) * 100) if provider_results else 0
+            provider_total = provider_totals[provider_name]
+            if provider_total:
+                provider_score = provider_mentions[provider_name] / provider_total * 100
                 provider_scores[provider_name] = round(provider_score, 2)
         
         # Average mention rank (lower is better, so invert for scoring)
-        ranks = [r.mention_rank for r in results if r.mention_rank is not None]
         avg_rank = sum(ranks) / len(ranks) if ranks else None
         
         # Keyword coverage
-        keywords_found = set()
-        for result in results:
-            if result.brand_found and result.prompt_metadata.get('keyword'):
-                keywords_found.add(result.prompt_metadata['keyword'])
         keywords_covered = len(keywords_found)
         keywords_total = len(project.keywords) if project.keywords else 0
         
@@ -260,7 +302,7 @@ class ScannerService:
         
         # Store score
         visibility_score = VisibilityScore(
-            id=str(uuid.uuid4()),
+            id=generate_id(),
             project_id=project.id,
             date=datetime.utcnow(),
             overall_score=score,
@@ -281,8 +323,6 @@ class ScannerService:
         project.previous_score = project.current_score
         project.current_score = score
         
-        self.db.commit()
-        
         logger.info(f"Visibility score calculated: {score}/100 ({score_trend})")
     
     def _get_provider_api_key(self, provider_name: str) -> str:
@@ -1,12 +1,51 @@
+import asyncio
 import httpx
 import logging
-from typing import Optional, Dict, Any, List
+import re
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, urljoin
 import xml.etree.ElementTree as ET
 
+from .http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
+SCHEME_RE = re.compile(r'^https?://', re.IGNORECASE)
+
+# Full site analyses keyed by URL, shared across service instances so
+# repeated questions about the same site skip the crawl
+SITE_CACHE_TTL = 900  # seconds
+SITE_CACHE_MAX_ENTRIES = 256
+_site_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+# One in-flight crawl per URL; concurrent callers wait and reuse its result.
+# Each lock stays registered while anyone holds or waits on it (counted in
+# _site_lock_users), so a later caller can never get a second lock for a URL.
+_site_locks: Dict[str, asyncio.Lock] = {}
+_site_lock_users: Dict[str, int] = {}
+
+def ensure_scheme(url: str) -> str:
+    """Prefix https:// unless the URL already has an http(s) scheme (any case)"""
+    return url if SCHEME_RE.match(url) else f'https://{url}'
+
+# Language prefixes like /en/, /de/, /en-us/, /pt_BR/ in front of the real section
+LOCALE_SEGMENT_RE = re.compile(r'^[a-z]{2}(?:[-_][a-z]{2,4})?$', re.IGNORECASE)
+
+def site_section(url: str) -> str:
+    """First path segment of a URL, skipping a leading locale segment"""
+    segments = [segment for segment in urlparse(url).path.lower().split('/') if segment]
+    if len(segments) > 1 and LOCALE_SEGMENT_RE.match(segments[0]):
+        return segments[1]
+    return segments[0] if segments else ''
+
+def normalize_url(url: str) -> str:
+    """Comparison key for a URL: no scheme, lowercase host, no trailing slash"""
+    # Only the host is case-insensitive; /About and /about can be different pages
+    parsed = urlparse(ensure_scheme(url))
+    key = parsed.netloc.lower() + parsed.path.rstrip('/')
+    return f"{key}?{parsed.query}" if parsed.query else key
+
 class WebScraperService:
     """Service for fetching and analyzing websites for SEO keyword research"""
     
@@ -25,8 +64,7 @@ class WebScraperService:
         """
         
         # Validate URL
-        if not url.startswith(('http://', 'https://')):
-            url = f'https://{url}'
+        url = ensure_scheme(url)
         
         try:
             parsed = urlparse(url)
@@ -34,43 +72,30 @@ class WebScraperService:
                 logger.error(f"Invalid URL: {url}")
                 return None
             
-            async with httpx.AsyncClient(follow_redirects=True) as client:
-                response = await client.get(
-                    url,
-                    timeout=self.timeout,
-                    headers={
-                        'User-Agent': 'Mozilla/5.0 (compatible; KeywordsChatBot/1.0; +https://keywordschat.com)',
-                    }
-                )
-                response.raise_for_status()
-                
-                # Check raw content length (prevent extremely large downloads)
-                content_size = len(response.content)
-                if content_size > self.max_content_length:
-                    logger.warning(f"Content too large for {url}: {content_size} bytes (max: {self.max_content_length})")
-                    return {
-                        'url': url,
-                        'error': f'Page too large to analyze ({content_size / 1024 / 1024:.1f}MB)'
-                    }
-                
-                logger.debug(f"Fetched {url}: {content_size / 1024:.1f}KB")
-                
-                # Parse HTML
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Extract SEO elements
-                result = {
+            response = await get_http_client().get(
+                url,
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={
+                    'User-Agent': 'Mozilla/5.0 (compatible; KeywordsChatBot/1.0; +https://keywordschat.com)',
+                }
+            )
+            response.raise_for_status()
+            
+            # Check raw content length (prevent extremely large downloads)
+            content_size = len(response.content)
+            if content_size > self.max_content_length:
+                logger.warning(f"Content too large for {url}: {content_size} bytes (max: {self.max_content_length})")
+                return {
                     'url': url,
-                    'title': self._get_title(soup),
-                    'meta_description': self._get_meta_description(soup),
-                    'meta_keywords': self._get_meta_keywords(soup),
-                    'headings': self._get_headings(soup),
-                    'main_content': self._get_main_content(soup),
-                    'links_count': len(soup.find_all('a')),
-                    'images_count': len(soup.find_all('img')),
+                    'error': f'Page too large to analyze ({content_size / 1024 / 1024:.1f}MB)'
                 }
-                
-                return result
+            
+            logger.debug(f"Fetched {url}: {content_size / 1024:.1f}KB")
+            
+            # HTML parsing is CPU-bound (pages can be several MB) - run it in a
+            # worker thread so it doesn't stall other requests on the event loop
+            return await asyncio.to_thread(self._parse_page, url, response.content)
                 
         except httpx.TimeoutException:
             logger.error(f"Timeout fetching {url}")
@@ -82,6 +107,21 @@ class WebScraperService:
             logger.error(f"Error fetching {url}: {e}")
             return {'url': url, 'error': str(e)}
     
+    def _parse_page(self, url: str, content: bytes) -> Dict[str, Any]:
+        """Parse HTML and extract SEO elements"""
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        return {
+            'url': url,
+            'title': self._get_title(soup),
+            'meta_description': self._get_meta_description(soup),
+            'meta_keywords': self._get_meta_keywords(soup),
+            'headings': self._get_headings(soup),
+            'main_content': self._get_main_content(soup),
+            'links_count': len(soup.find_all('a')),
+            'images_count': len(soup.find_all('img')),
+        }
+    
     def _get_title(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract page title"""
         title_tag = soup.find('title')
@@ -142,8 +182,7 @@ class WebScraperService:
         Fetch sitemap.xml and return list of URLs
         Returns empty list if sitemap not found
         """
-        if not base_url.startswith(('http://', 'https://')):
-            base_url = f'https://{base_url}'
+        base_url = ensure_scheme(base_url)
         
         parsed = urlparse(base_url)
         sitemap_urls = [
@@ -154,35 +193,38 @@ class WebScraperService:
         
         for sitemap_url in sitemap_urls:
             try:
-                async with httpx.AsyncClient(follow_redirects=True) as client:
-                    response = await client.get(sitemap_url, timeout=self.timeout)
-                    response.raise_for_status()
-                    
-                    # Parse XML
-                    root = ET.fromstring(response.content)
-                    
-                    # Handle both sitemap and sitemap index
-                    urls = []
-                    
-                    # Standard sitemap namespace
-                    ns = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
-                    
-                    # Try to find URLs
-                    for loc in root.findall('.//ns:loc', ns):
+                response = await get_http_client().get(
+                    sitemap_url,
+                    timeout=self.timeout,
+                    follow_redirects=True
+                )
+                response.raise_for_status()
+                
+                # Parse XML
+                root = ET.fromstring(response.content)
+                
+                # Handle both sitemap and sitemap index
+                urls = []
+                
+                # Standard sitemap namespace
+                ns = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
+                
+                # Try to find URLs
+                for loc in root.findall('.//ns:loc', ns):
+                    url = loc.text
+                    if url:
+                        urls.append(url)
+                
+                # Also try without namespace (some sites don't use it)
+                if not urls:
+                    for loc in root.findall('.//loc'):
                         url = loc.text
                         if url:
                             urls.append(url)
-                    
-                    # Also try without namespace (some sites don't use it)
-                    if not urls:
-                        for loc in root.findall('.//loc'):
-                            url = loc.text
-                            if url:
-                                urls.append(url)
-                    
-                    if urls:
-                        logger.info(f"Found sitemap at {sitemap_url} with {len(urls)} URLs")
-                        return urls[:self.max_pages_to_crawl * 2]  # Return more URLs for filtering
+                
+                if urls:
+                    logger.info(f"Found sitemap at {sitemap_url} with {len(urls)} URLs")
+                    return urls[:self.max_pages_to_crawl * 2]  # Return more URLs for filtering
                     
             except Exception as e:
                 logger.debug(f"No sitemap at {sitemap_url}: {e}")
@@ -196,10 +238,53 @@ class WebScraperService:
         Comprehensive site analysis: main page + sitemap + key pages
         Returns aggregated data for SEO keyword analysis
         """
-        if not url.startswith(('http://', 'https://')):
-            url = f'https://{url}'
+        url = ensure_scheme(url)
+        
+        cached = self._get_cached_site(url)
+        if cached:
+            return cached
+        
+        lock = _site_locks.setdefault(url, asyncio.Lock())
+        _site_lock_users[url] = _site_lock_users.get(url, 0) + 1
+        try:
+            async with lock:
+                # Another request may have finished crawling while we waited
+                cached = self._get_cached_site(url)
+                if cached:
+                    return cached
+                
+                result = await self._crawl_site(url)
+                
+                # Only cache successful analyses so transient failures are retried
+                if 'error' not in result:
+                    _site_cache.pop(url, None)
+                    if len(_site_cache) >= SITE_CACHE_MAX_ENTRIES:
+                        # Dicts keep insertion order, so this evicts the oldest entry
+                        _site_cache.pop(next(iter(_site_cache)))
+                    _site_cache[url] = (time.monotonic(), result)
+        finally:
+            _site_lock_users[url] -= 1
+            if not _site_lock_users[url]:
+                del _site_lock_users[url]
+                del _site_locks[url]
         
+        return result
+    
+    def _get_cached_site(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return a cached site analysis if it is still fresh"""
+        cached = _site_cache.get(url)
+        if cached and time.monotonic() - cached[0] < SITE_CACHE_TTL:
+            logger.info(f"Using cached site analysis for {url}")
+            return cached[1]
+        return None
+    
+    async def _crawl_site(self, url: str) -> Dict[str, Any]:
+        """Crawl main page, sitemap and key pages for analyze_full_site"""
         parsed = urlparse(url)
+        if not parsed.netloc:
+            # Reject before any network work
+            logger.error(f"Invalid URL: {url}")
+            return {'url': url, 'error': 'Invalid URL'}
         base_url = f"{parsed.scheme}://{parsed.netloc}"
         
         logger.info(f"Starting full site analysis for {url}")
@@ -220,24 +305,38 @@ class WebScraperService:
         
         if sitemap_urls:
             # Prioritize important pages from sitemap
-            priority_paths = ['about', 'features', 'pricing', 'product', 'service', 'how-it-works', 'solutions']
+            priority_paths = ('about', 'features', 'pricing', 'product', 'service', 'how-it-works', 'solutions')
+            
+            # Normalized keys so http/https and trailing-slash variants of
+            # the same page are treated as one
+            sitemap_keys = {normalize_url(sitemap_url) for sitemap_url in sitemap_urls}
+            crawl_keys = set()
             
             # Add homepage if not already in sitemap
-            if url not in sitemap_urls and base_url not in sitemap_urls:
+            if normalize_url(url) not in sitemap_keys and normalize_url(base_url) not in sitemap_keys:
                 pages_to_crawl.append(url)
+                crawl_keys.add(normalize_url(url))
             
             # Find priority pages
             for sitemap_url in sitemap_urls:
-                if any(path in sitemap_url.lower() for path in priority_paths):
+                # Match the top-level path segment only (after any /en/-style
+                # prefix), so hosts like product.example.com or posts like
+                # /blog/about-our-retreat don't count
+                section = site_section(sitemap_url)
+                key = normalize_url(sitemap_url)
+                if section.startswith(priority_paths) and key not in crawl_keys:
                     pages_to_crawl.append(sitemap_url)
+                    crawl_keys.add(key)
                     if len(pages_to_crawl) >= self.max_pages_to_crawl:
                         break
             
             # Fill remaining slots with other pages
             if len(pages_to_crawl) < self.max_pages_to_crawl:
                 for sitemap_url in sitemap_urls:
-                    if sitemap_url not in pages_to_crawl:
+                    key = normalize_url(sitemap_url)
+                    if key not in crawl_keys:
                         pages_to_crawl.append(sitemap_url)
+                        crawl_keys.add(key)
                         if len(pages_to_crawl) >= self.max_pages_to_crawl:
                             break
         else:
@@ -246,12 +345,10 @@ class WebScraperService:
         
         logger.info(f"Crawling {len(pages_to_crawl)} pages: {pages_to_crawl}")
         
-        # Fetch all pages
-        pages_data = []
-        for page_url in pages_to_crawl:
-            page_data = await self.fetch_website(page_url)
-            if page_data and 'error' not in page_data:
-                pages_data.append(page_data)
+        # Fetch all pages concurrently; fetch_website reports failures in
+        # the returned dict rather than raising
+        fetched = await asyncio.gather(*(self.fetch_website(page_url) for page_url in pages_to_crawl))
+        pages_data = [page_data for page_data in fetched if page_data and 'error' not in page_data]
         
         # Aggregate data from all pages
         return self._aggregate_site_data(main_page, pages_data, sitemap_urls)
@@ -279,17 +376,25 @@ class WebScraperService:
         all_h2s = list(main_page.get('headings', {}).get('h2', []))
         all_titles = [main_page.get('title')] if main_page.get('title') else []
         
+        # Sets mirror the lists for O(1) duplicate checks; lists keep page order
+        seen_titles = set(all_titles)
+        seen_h1s = set(all_h1s)
+        seen_h2s = set(all_h2s)
+        
         for page in pages_data:
             page_title = page.get('title')
-            if page_title and page_title not in all_titles:
+            if page_title and page_title not in seen_titles:
+                seen_titles.add(page_title)
                 all_titles.append(page_title)
             
             for h1 in page.get('headings', {}).get('h1', []):
-                if h1 not in all_h1s:
+                if h1 not in seen_h1s:
+                    seen_h1s.add(h1)
                     all_h1s.append(h1)
             
             for h2 in page.get('headings', {}).get('h2', []):
-                if h2 not in all_h2s and len(all_h2s) < 20:  # Limit to avoid overwhelming
+                if h2 not in seen_h2s and len(all_h2s) < 20:  # Limit to avoid overwhelming
+                    seen_h2s.add(h2)
                     all_h2s.append(h2)
         
         result['all_page_titles'] = all_titles